@@ -1,29 +1,72 @@
 import argparse
+import functools
+import hashlib
+import io
+import json
+import math
 import os
+import shutil
 import subprocess
 import tempfile
 import re
+import numpy as np
+import orjson
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import av
+except ImportError:
+    av = None  # Fall back to ffprobe for duration reads
 from funasr import AutoModel
 from gtts import gTTS
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 # Load environment variables
 load_dotenv()
 
+# Shared HTTP session so repeated API calls reuse the same HTTPS connection
+# instead of paying a fresh DNS + TCP + TLS handshake each time
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Resolve the ffmpeg binaries once instead of a $PATH search per spawn;
+# leaving inherited fds open also skips the close-fd loop in the forked child
+FFMPEG = shutil.which('ffmpeg') or 'ffmpeg'
+FFPROBE = shutil.which('ffprobe') or 'ffprobe'
+PIPER = shutil.which('piper')
+_SPAWN_KWARGS = {'close_fds': False} if os.name == 'posix' else {}
+
+
+# Unicode codepoint ranges used by the word counters
+_CHINESE_RANGE = (0x4e00, 0x9fff)
+_THAI_RANGE = (0x0e00, 0x0e7f)
+
+# Compiled once; used to detect whether a translation actually came back Thai
+_THAI_RE = re.compile(r'[฀-๿]')
+
+def _codepoints(text):
+    """View a str as a uint32 array of codepoints for vectorized range checks"""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
 
 def count_chinese_words(text):
     """Count Chinese characters (each character is considered a word)"""
-    # Remove spaces, punctuation, and non-Chinese characters
-    chinese_chars = re.findall(r'[\u4e00-\u9fff]', text)
-    return len(chinese_chars)
+    if not text:
+        return 0
+    codepoints = _codepoints(text)
+    lo, hi = _CHINESE_RANGE
+    return int(((codepoints >= lo) & (codepoints <= hi)).sum())
 
 def count_thai_words(text):
-    """Count Thai words (split by spaces and Thai word boundaries)"""
-    # Remove punctuation and split by spaces
-    words = re.findall(r'[\u0e00-\u0e7f]+', text)
-    return len(words)
+    """Count Thai words (runs of consecutive Thai characters)"""
+    if not text:
+        return 0
+    codepoints = _codepoints(text)
+    lo, hi = _THAI_RANGE
+    mask = (codepoints >= lo) & (codepoints <= hi)
+    # Each word is one run of Thai characters; count where a run starts
+    return int(mask[0]) + int((mask[1:] & ~mask[:-1]).sum())
 
 def count_english_words(text):
     """Count English words (split by whitespace)"""
@@ -31,19 +74,50 @@ def count_english_words(text):
     return len(words)
 
 def extract_audio(video_path, audio_path):
+    # 16 kHz mono is what FunASR resamples to anyway; writing the WAV at the
+    # source rate/channels just inflates it ~6x for no benefit
     subprocess.run([
-        'ffmpeg', '-y', '-i', video_path, '-vn', '-acodec', 'pcm_s16le', audio_path
-    ], check=True)
+        FFMPEG, '-y', '-i', video_path, '-vn', '-ac', '1', '-ar', '16000',
+        '-acodec', 'pcm_s16le', audio_path
+    ], check=True, **_SPAWN_KWARGS)
+
+@functools.lru_cache(maxsize=1)
+def _get_model():
+    """Load the FunASR model once; the Paraformer weights take seconds to
+    deserialize, so repeated calls must reuse the loaded instance"""
+    return AutoModel(model="paraformer-zh", disable_update=True)
+
+def transcribe_video(video_path):
+    """Transcribe a video's audio track by piping 16 kHz mono PCM from ffmpeg
+    straight into FunASR, skipping the intermediate WAV file"""
+    try:
+        proc = subprocess.run([
+            FFMPEG, '-v', 'quiet', '-i', video_path, '-vn',
+            '-ac', '1', '-ar', '16000', '-f', 's16le', 'pipe:1'
+        ], capture_output=True, check=True, **_SPAWN_KWARGS)
+        pcm = np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+
+        model = _get_model()
+        result = model.generate(input=pcm, fs=16000)
+
+        if result and len(result) > 0:
+            return result[0]['text']
+        else:
+            print("Warning: No transcription result from FunASR")
+            return ""
+
+    except Exception as e:
+        print(f"FunASR transcription error: {e}")
+        return ""
 
 def transcribe_audio(audio_path):
     """Transcribe audio using FunASR for better Chinese speech recognition"""
     try:
-        # Initialize FunASR model with update check disabled
-        model = AutoModel(model="paraformer-zh", disable_update=True)
-        
+        model = _get_model()
+
         # Transcribe the audio
         result = model.generate(input=audio_path)
-        
+
         # Extract the transcribed text
         if result and len(result) > 0:
             transcribed_text = result[0]['text']
@@ -56,6 +130,59 @@ def transcribe_audio(audio_path):
         print(f"FunASR transcription error: {e}")
         return ""
 
+# On-disk cache for Google Translate results so re-runs of the same video
+# (or retries after a TTS failure) skip the paid API call entirely
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'tt')
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'translations.json')
+_CACHE_TTL = 7 * 86400  # Cached translations expire after a week
+_translation_cache = None
+
+def _load_translation_cache():
+    global _translation_cache
+    if _translation_cache is None:
+        try:
+            with open(_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _translation_cache = json.load(f)
+        except (OSError, ValueError):
+            _translation_cache = {}
+    return _translation_cache
+
+def _translation_cache_get(key):
+    entry = _load_translation_cache().get(key)
+    if entry and entry[1] > time.time():
+        return entry[0]
+    return None
+
+def _translation_cache_set(key, value):
+    cache = _load_translation_cache()
+    cache[key] = [value, time.time() + _CACHE_TTL]
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"Translation cache write error: {e}")
+
+def cached_translation(fixed_target=None):
+    """Decorator that caches translation results on (sha1(text), target lang)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(text, *args, **kwargs):
+            target = fixed_target or kwargs.get('target_lang') or (args[0] if args else 'en')
+            key = hashlib.sha1(f"{target}:{text}".encode()).hexdigest()
+            cached = _translation_cache_get(key)
+            if cached is not None:
+                return cached
+            result = func(text, *args, **kwargs)
+            # The translate functions return the source text on failure;
+            # don't cache that
+            if result != text:
+                _translation_cache_set(key, result)
+            return result
+        return wrapper
+    return decorator
+
+@cached_translation()
 def translate_text(text, target_lang="en"):
     """Translate text using Google Translate API to a specified language (default: English)"""
     try:
@@ -69,47 +196,91 @@ def translate_text(text, target_lang="en"):
             'source': 'zh',
             'target': target_lang
         }
-        response = requests.post(url, data=params)
+        response = _SESSION.post(url, data=params, timeout=15)
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
         translated_text = result['data']['translations'][0]['translatedText']
         return translated_text
     except Exception as e:
         print(f"Google Translate API error: {e}")
         return text
 
-def text_to_speech(text, tts_path, speed_factor=1.0):
-    """Convert text to speech"""
+def text_to_speech(text, stream):
+    """Convert text to speech, writing audio data to an open binary stream.
+
+    Prefers a local piper model (set PIPER_MODEL in the environment to the
+    .onnx voice path) since gTTS fetches the audio from Google in serial
+    ~200-char chunks; falls back to gTTS when piper is not available."""
+    piper_model = os.getenv('PIPER_MODEL')
+    if PIPER and piper_model:
+        try:
+            result = subprocess.run(
+                [PIPER, '--model', piper_model, '--output_file', '-'],
+                input=text.encode('utf-8'), stdout=subprocess.PIPE,
+                check=True, **_SPAWN_KWARGS)
+            stream.write(result.stdout)
+            return
+        except Exception as e:
+            print(f"Piper TTS error: {e}")
+            print("Falling back to gTTS...")
+
     try:
         # Use gTTS to generate speech
         tts = gTTS(text, lang='th', slow=False)
-        tts.save(tts_path)
-            
+        tts.write_to_fp(stream)
+
     except Exception as e:
         print(f"TTS error: {e}")
-        # Fallback to normal TTS
+        # Fallback to normal TTS; discard anything the failed attempt wrote
+        stream.seek(0)
+        stream.truncate()
         tts = gTTS(text, lang='th')
-        tts.save(tts_path)
+        tts.write_to_fp(stream)
+
+def _container_duration(source):
+    """Read the duration field from a container header in-process via PyAV,
+    avoiding an ffprobe fork; returns None if PyAV is missing or fails"""
+    if av is None:
+        return None
+    try:
+        with av.open(source) as container:
+            if container.duration is not None:
+                return container.duration / 1_000_000
+    except Exception:
+        pass
+    return None
 
 def get_video_duration(video_path):
     """Get video duration in seconds"""
+    duration = _container_duration(video_path)
+    if duration is not None:
+        return duration
+    # Fall back to ffprobe
     try:
         result = subprocess.run([
-            'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', 
+            FFPROBE, '-v', 'quiet', '-show_entries', 'format=duration',
             '-of', 'csv=p=0', video_path
-        ], capture_output=True, text=True, check=True)
+        ], capture_output=True, text=True, check=True, **_SPAWN_KWARGS)
         return float(result.stdout.strip())
     except:
         return None
 
 def get_audio_duration(audio_path):
     """Get audio duration in seconds"""
+    return get_video_duration(audio_path)
+
+def get_audio_duration_from_bytes(audio_bytes):
+    """Get audio duration in seconds from in-memory audio data"""
+    duration = _container_duration(io.BytesIO(audio_bytes))
+    if duration is not None:
+        return duration
+    # Fall back to ffprobe reading from stdin
     try:
         result = subprocess.run([
-            'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration', 
-            '-of', 'csv=p=0', audio_path
-        ], capture_output=True, text=True, check=True)
-        return float(result.stdout.strip())
+            FFPROBE, '-v', 'quiet', '-show_entries', 'format=duration',
+            '-of', 'csv=p=0', 'pipe:0'
+        ], input=audio_bytes, capture_output=True, check=True, **_SPAWN_KWARGS)
+        return float(result.stdout.decode().strip())
     except:
         return None
 
@@ -123,11 +294,34 @@ def calculate_optimal_speed(video_duration, audio_duration):
         return audio_duration / video_duration
     return 1.5  # Default speed factor (no change)
 
-def replace_audio(video_path, audio_path, output_path):
-    subprocess.run([
-        'ffmpeg', '-y', '-i', video_path, '-i', audio_path, '-c:v', 'copy', '-map', '0:v:0', '-map', '1:a:0', '-shortest', output_path
-    ], check=True)
+def _atempo_chain(speed_factor):
+    """Build the comma-joined atempo filter string for any speed factor.
+
+    A single atempo stage is limited to 0.5x-2.0x, so factors outside that
+    range are factored closed-form via log2 into n stages of 2.0 (or 0.5)
+    plus one residual stage; the stage products multiply back to the exact
+    requested factor."""
+    if speed_factor == 1.0:
+        return 'anull'
+    if 0.5 <= speed_factor <= 2.0:
+        return f'atempo={speed_factor}'
+    if speed_factor > 2.0:
+        n = math.floor(math.log2(speed_factor))
+        residual = speed_factor / (2 ** n)
+        chain = ['atempo=2.0'] * n
+    else:
+        n = math.floor(math.log2(1 / speed_factor))
+        residual = speed_factor * (2 ** n)
+        chain = ['atempo=0.5'] * n
+    if residual != 1.0:
+        chain.append(f'atempo={residual}')
+    return ','.join(chain)
 
+def translate_zh_to_th_google(text):
+    """Translate Chinese directly to Thai using Google Translate API"""
+    return translate_text(text, target_lang="th")
+
+@cached_translation('th')
 def translate_english_to_thai_google(english_text):
     """Translate English to Thai using Google Translate API"""
     try:
@@ -141,9 +335,9 @@ def translate_english_to_thai_google(english_text):
             'source': 'en',
             'target': 'th'
         }
-        response = requests.post(url, data=params)
+        response = _SESSION.post(url, data=params, timeout=15)
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
         translated_text = result['data']['translations'][0]['translatedText']
         return translated_text
     except Exception as e:
@@ -159,36 +353,43 @@ def main():
     parser.add_argument('input_video', help='Path to input video file')
     parser.add_argument('output_video', help='Path to output video file')
     parser.add_argument('--thai_file', help='Path to Thai translation text file (optional, for manual translation)')
+    parser.add_argument('--show-english', action='store_true', help='Also translate to English and print it (costs an extra API call)')
     args = parser.parse_args()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor(max_workers=2) as executor:
         audio_wav = os.path.join(tmpdir, 'audio.wav')
-        thai_mp3 = os.path.join(tmpdir, 'thai.mp3')
 
-        # Step 1: Extract audio
-        step_start = time.time()
-        print('Extracting audio...')
-        extract_audio(args.input_video, audio_wav)
-        step_time = time.time() - step_start
-        print(f'✅ Audio extraction completed in {step_time:.1f} seconds')
+        # Probe the video duration in the background; it is only needed at
+        # the TTS stage, so the ffprobe overlaps with extraction,
+        # transcription and translation
+        video_duration_future = executor.submit(get_video_duration, args.input_video)
 
-        # Step 2: Transcribe Chinese speech
+        # Steps 1-2: Decode audio and transcribe in one streaming pass
+        # (no intermediate WAV on disk)
         step_start = time.time()
         print('Transcribing Chinese speech...')
-        chinese_text = transcribe_audio(audio_wav)
+        chinese_text = transcribe_video(args.input_video)
+        if not chinese_text:
+            # Fall back to the file-based extract + transcribe route
+            print('Streaming transcription failed; extracting audio to disk...')
+            extract_audio(args.input_video, audio_wav)
+            chinese_text = transcribe_audio(audio_wav)
         chinese_word_count = count_chinese_words(chinese_text)
         step_time = time.time() - step_start
         print(f'✅ Transcription completed in {step_time:.1f} seconds')
         print(f'Chinese text ({chinese_word_count} words): {chinese_text}')
 
-        # Step 3: Translate to English
-        step_start = time.time()
-        print('Translating to English...')
-        english_text = translate_text(chinese_text, target_lang="en")
-        english_word_count = count_english_words(english_text)
-        step_time = time.time() - step_start
-        print(f'✅ English translation completed in {step_time:.1f} seconds')
-        print(f'English text ({english_word_count} words): {english_text}')
+        # Step 3: Optionally translate to English for logging
+        english_text = None
+        english_word_count = 0
+        if args.show_english:
+            step_start = time.time()
+            print('Translating to English...')
+            english_text = translate_text(chinese_text, target_lang="en")
+            english_word_count = count_english_words(english_text)
+            step_time = time.time() - step_start
+            print(f'✅ English translation completed in {step_time:.1f} seconds')
+            print(f'English text ({english_word_count} words): {english_text}')
 
         # Step 4: Handle Thai translation
         step_start = time.time()
@@ -197,12 +398,15 @@ def main():
             with open(args.thai_file, 'r', encoding='utf-8') as f:
                 thai_text = f.read().strip()
         else:
-            print('Translating English to Thai using Google Translate API...')
-            thai_text = translate_english_to_thai_google(english_text)
-            
+            print('Translating Chinese to Thai using Google Translate API...')
+            thai_future = executor.submit(translate_zh_to_th_google, chinese_text)
+            thai_text = thai_future.result()
+
             # If Google Translate failed and no manual file provided, save English text for manual translation
-            if not re.search(r'[\u0e00-\u0e7f]', thai_text):
+            if not _THAI_RE.search(thai_text):
                 print('\n⚠️  Google Translate API failed. English text saved for manual translation.')
+                if english_text is None:
+                    english_text = translate_text(chinese_text, target_lang="en")
                 manual_file = 'english_for_translation.txt'
                 with open(manual_file, 'w', encoding='utf-8') as f:
                     f.write(english_text)
@@ -216,138 +420,60 @@ def main():
         print(f'✅ Thai translation completed in {step_time:.1f} seconds')
         print(f'Thai text ({thai_word_count} words): {thai_text}')
 
-        # Step 5: Convert to speech and adjust speed
+        # Step 5: Convert to speech and calculate speed adjustment
         step_start = time.time()
         print('Converting Thai text to speech...')
-        video_duration = get_video_duration(args.input_video)
+        video_duration = video_duration_future.result()
         print(f'Video duration: {video_duration:.1f} seconds')
-        
-        # Generate initial TTS
-        text_to_speech(thai_text, thai_mp3)
-        audio_duration = get_audio_duration(thai_mp3)
+
+        # Generate initial TTS in memory; the MP3 is piped to ffmpeg later
+        # instead of going through a temp file on disk
+        tts_buf = io.BytesIO()
+        text_to_speech(thai_text, tts_buf)
+        tts_bytes = tts_buf.getvalue()
+        audio_duration = get_audio_duration_from_bytes(tts_bytes)
         print(f'Initial TTS duration: {audio_duration:.1f} seconds')
-        
-        # Calculate and apply speed adjustment if needed
+
+        # Calculate speed adjustment
         speed_factor = calculate_optimal_speed(video_duration, audio_duration)
+        if abs(speed_factor - 1.0) < 0.02:
+            # Within 2% of real time the difference is inaudible; skip atempo
+            speed_factor = 1.0
         print(f'Calculated speed factor: {speed_factor:.2f}x')
-        
-        if speed_factor != 1.0:
-            print(f'Adjusting audio speed to match video duration...')
-            # Apply speed adjustment to existing audio file
-            temp_mp3 = thai_mp3 + '.temp'
-            os.rename(thai_mp3, temp_mp3)
-            
-            # Use ffmpeg to change speed without affecting pitch
-            # atempo filter has limits (0.5x to 2.0x), so we need to chain multiple filters
-            if speed_factor > 2.0:
-                # For high speed factors, chain multiple atempo filters
-                # Calculate how many 2.0x filters we need
-                remaining_factor = speed_factor
-                filter_chain = []
-                while remaining_factor > 2.0:
-                    filter_chain.append("atempo=2.0")
-                    remaining_factor /= 2.0
-                if remaining_factor > 1.0:
-                    filter_chain.append(f"atempo={remaining_factor}")
-                filter_str = ",".join(filter_chain)
-                print(f'Using chained atempo filters: {filter_str}')
-            elif speed_factor < 0.5:
-                # For low speed factors, chain multiple atempo filters
-                # Calculate how many 0.5x filters we need
-                remaining_factor = speed_factor
-                filter_chain = []
-                while remaining_factor < 0.5:
-                    filter_chain.append("atempo=0.5")
-                    remaining_factor /= 0.5
-                if remaining_factor < 1.0:
-                    filter_chain.append(f"atempo={remaining_factor}")
-                filter_str = ",".join(filter_chain)
-                print(f'Using chained atempo filters: {filter_str}')
-            else:
-                filter_str = f'atempo={speed_factor}'
-                print(f'Using single atempo filter: {filter_str}')
-            
-            try:
-                subprocess.run([
-                    'ffmpeg', '-y', '-i', temp_mp3, 
-                    '-filter:a', filter_str, 
-                    thai_mp3
-                ], check=True, capture_output=True, text=True)
-                
-                # Clean up temp file
-                os.remove(temp_mp3)
-                
-                # Verify final duration
-                final_audio_duration = get_audio_duration(thai_mp3)
-                print(f'Final TTS duration: {final_audio_duration:.1f} seconds')
-                
-                # Check if adjustment was successful
-                if final_audio_duration and video_duration and abs(final_audio_duration - video_duration) > 1.0:
-                    print(f'⚠️  Warning: Audio duration ({final_audio_duration:.1f}s) still differs significantly from video duration ({video_duration:.1f}s)')
-                    print(f'   Speed factor applied: {speed_factor:.2f}x')
-                    print(f'   Difference: {abs(final_audio_duration - video_duration):.1f} seconds')
-                    
-                    # If audio is still longer than video, try to truncate it
-                    if final_audio_duration > video_duration + 1.0:
-                        print(f'   Audio is still too long. Truncating to match video duration...')
-                        try:
-                            # Create a temporary file for truncation
-                            temp_truncate = thai_mp3 + '.truncate'
-                            os.rename(thai_mp3, temp_truncate)
-                            
-                            # Truncate audio to video duration
-                            subprocess.run([
-                                'ffmpeg', '-y', '-i', temp_truncate, 
-                                '-t', str(video_duration), 
-                                thai_mp3
-                            ], check=True, capture_output=True, text=True)
-                            
-                            # Clean up temp file
-                            os.remove(temp_truncate)
-                            
-                            # Verify final duration
-                            final_audio_duration = get_audio_duration(thai_mp3)
-                            print(f'   Final TTS duration after truncation: {final_audio_duration:.1f} seconds')
-                            
-                        except subprocess.CalledProcessError as e:
-                            print(f'   ❌ Truncation failed: {e}')
-                            print(f'   Using speed-adjusted audio as is')
-                            # Restore the speed-adjusted file
-                            os.rename(temp_truncate, thai_mp3)
-            except subprocess.CalledProcessError as e:
-                print(f'❌ Speed adjustment failed: {e}')
-                print(f'   Trying alternative approach with rubberband filter...')
-                
-                # Fallback to rubberband filter if atempo fails
-                try:
-                    subprocess.run([
-                        'ffmpeg', '-y', '-i', temp_mp3, 
-                        '-filter:a', f'rubberband=tempo={speed_factor}', 
-                        thai_mp3
-                    ], check=True, capture_output=True, text=True)
-                    
-                    # Clean up temp file
-                    os.remove(temp_mp3)
-                    
-                    # Verify final duration
-                    final_audio_duration = get_audio_duration(thai_mp3)
-                    print(f'Final TTS duration (rubberband): {final_audio_duration:.1f} seconds')
-                    
-                except subprocess.CalledProcessError as e2:
-                    print(f'❌ Rubberband filter also failed: {e2}')
-                    print(f'   Using original audio without speed adjustment')
-                    # Restore original file
-                    os.rename(temp_mp3, thai_mp3)
-        else:
+
+        # Build the atempo filter string for the mux step
+        filter_str = _atempo_chain(speed_factor)
+        if filter_str == 'anull':
             print('No speed adjustment needed')
-        
+        else:
+            print(f'Using atempo filter chain: {filter_str}')
+
         step_time = time.time() - step_start
         print(f'✅ TTS generation completed in {step_time:.1f} seconds')
 
-        # Step 6: Replace audio in video
+        # Step 6: Speed-adjust, truncate and mux in a single ffmpeg pass
+        # (one MP3 decode+encode instead of three, fewer process launches)
         step_start = time.time()
         print('Replacing audio in video...')
-        replace_audio(args.input_video, thai_mp3, args.output_video)
+        mux_cmd = [
+            FFMPEG, '-y', '-i', args.input_video, '-i', 'pipe:0',
+            '-filter_complex', f'[1:a]{filter_str}[a]',
+            '-map', '0:v:0', '-map', '[a]', '-c:v', 'copy'
+        ]
+        if video_duration:
+            mux_cmd += ['-t', str(video_duration)]
+        # Use all cores for the mux and put the moov atom up front so the
+        # output MP4 is web-streamable
+        mux_cmd += ['-shortest', '-movflags', '+faststart', '-threads', '0', args.output_video]
+        try:
+            subprocess.run(mux_cmd, input=tts_bytes, check=True, capture_output=True, **_SPAWN_KWARGS)
+        except subprocess.CalledProcessError as e:
+            print(f'❌ Speed adjustment failed: {e}')
+            print(f'   Trying alternative approach with rubberband filter...')
+
+            # Fallback to rubberband filter if atempo fails
+            mux_cmd[mux_cmd.index('-filter_complex') + 1] = f'[1:a]rubberband=tempo={speed_factor}[a]'
+            subprocess.run(mux_cmd, input=tts_bytes, check=True, capture_output=True, **_SPAWN_KWARGS)
         step_time = time.time() - step_start
         print(f'✅ Video processing completed in {step_time:.1f} seconds')
 
@@ -357,7 +483,8 @@ def main():
         print('🎉 Done! Output saved to', args.output_video)
         print(f'\n📊 Summary:')
         print(f'Chinese words: {chinese_word_count}')
-        print(f'English words: {english_word_count}')
+        if args.show_english:
+            print(f'English words: {english_word_count}')
         print(f'Thai words: {thai_word_count}')
         print(f'⏱️  Total execution time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)')
 